@@ -1,5 +1,5 @@
 """glob glob glob."""
-import glob
+import fnmatch
 import os
 
 
@@ -12,21 +12,28 @@ def list_dir(path, ext='*.*', recursive=False) -> list:
         recursive (bool, optional): _description_. Defaults to False.
 
     Returns:
-        list: list of files from defined path
+        list: list of (absolute path, stat_result) pairs from defined path.
+            Only files are listed; directories matching ext are skipped.
+            recursive is accepted but currently ignored.
     """
     work_list = []
-    os.chdir(path)
-    for file in glob.iglob(ext):
-        work_list.append(file)
+    abs_path = os.path.abspath(path)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # glob skips hidden files unless the pattern asks for them
+            if entry.name.startswith('.') and not ext.startswith('.'):
+                continue
+            if entry.is_file() and fnmatch.fnmatch(entry.name, ext):
+                work_list.append((os.path.join(abs_path, entry.name), entry.stat()))
     del recursive
     return work_list
 
 
-def get_file_size(file, out='kb'):
+def get_file_size(entry, out='kb'):
     """_summary_
 
     Args:
-        file (_type_): _description_
+        entry (tuple): (path, stat_result) pair as returned by list_dir
         out (str, optional): _description_. Defaults to 'kb'.
 
     Returns:
@@ -39,5 +46,5 @@ def get_file_size(file, out='kb'):
         out_div = 1024*1024
         ext = 'MB'
 
-
-    return f'{file} : {round(os.stat(file).st_size/out_div,2)}{ext}'
+    file, stat = entry
+    return f'{file} : {round(stat.st_size/out_div,2)}{ext}'